@@ -71,6 +71,7 @@ def _set_up():
                 'pytest',
                 'pytest-cov',
                 'pytest-mock',
+                'pytest-xdist',
             ],
         },
         package_data={
@@ -17,6 +17,12 @@ def _parse_args(args):
         help='Regular expression applied to '
         'firmware information string to filter the result.'
     )
+    parser.add_argument(
+        '--dongle-only', action='store_true',
+        help='Query only the ports with the USB VID/PID of OpenBCI dongle '
+        '(0403:6015), unless none is found. By default all the ports '
+        'are queried.'
+    )
     parser.add_argument('--debug', action='store_true')
     return parser.parse_args(args)
 
@@ -27,6 +33,8 @@ def main(args):
     For the detail of the command, use ``list_devices --help``.
     """
     args = _parse_args(args)
-    for port in util.list_devices(filter_regex=args.filter):
+    ports = util.list_devices(
+        filter_regex=args.filter, strict_vid=args.dongle_only)
+    for port in ports:
         sys.stdout.write(port)
         sys.stdout.write('\n')
@@ -6,15 +6,55 @@ from openbci_interface import exception
 
 _LG = logging.getLogger(__name__)
 
-
-def _interpret_24bit_as_int32(raw):
-    prefix = b'\xFF' if struct.unpack('3b', raw)[0] & 0x80 > 0 else b'\x00'
-    return struct.unpack('>i', prefix + raw)[0]
-
-
-def _interpret_16bit_as_int32(raw):
-    prefix = b'\xFF' if struct.unpack('2b', raw)[0] & 0x80 > 0 else b'\x00'
-    return struct.unpack('>i', prefix * 2 + raw)[0]
+# Cyton packet following the start byte; packet ID, eight 24-bit EEG values,
+# three 16-bit AUX values and stop byte, all big-endian.
+# Each EEG value is split into a signed high byte and an unsigned low word,
+# so that struct takes care of the sign extension.
+_PACKET_FORMAT = '>B' + 'bH' * 8 + '3h' + 'B'
+_PACKET = struct.Struct(_PACKET_FORMAT)
+# Packet followed by the start byte of the next packet, so that a run of
+# consecutive packets can be decoded with a single `iter_unpack` call.
+_FRAME = struct.Struct(_PACKET_FORMAT + 'B')
+
+# Commands to turn on/off channels 1 - 16
+ENABLE_CHANNEL_COMMANDS = (
+    b'!', b'@', b'#', b'$', b'%', b'^', b'&', b'*',
+    b'Q', b'W', b'E', b'R', b'T', b'Y', b'U', b'I',
+)
+DISABLE_CHANNEL_COMMANDS = (
+    b'1', b'2', b'3', b'4', b'5', b'6', b'7', b'8',
+    b'q', b'w', b'e', b'r', b't', b'y', b'u', b'i',
+)
+# Commands to set sample rate, following ``~``, keyed by sample rate
+SAMPLE_RATE_COMMANDS = {
+    250: b'6', 500: b'5', 1000: b'4',
+    2000: b'3', 4000: b'2', 8000: b'1', 16000: b'0',
+}
+# Commands to set board mode, following ``/``, keyed by mode name
+BOARD_MODE_COMMANDS = {
+    'default': b'0',
+    'debug': b'1',
+    'analog': b'2',
+    'digital': b'3',
+    'marker': b'4',
+}
+_SAMPLE_RATE_CODES = tuple(SAMPLE_RATE_COMMANDS.values())
+_BOARD_MODE_CODES = tuple(BOARD_MODE_COMMANDS.values())
+
+
+def _unpack_packet(buffer):
+    return _to_packet(_PACKET.unpack_from(buffer))
+
+
+def _to_packet(vals):
+    return {
+        'packet_id': vals[0],
+        'raw_eeg': [
+            (high << 16) | low
+            for high, low in zip(vals[1:17:2], vals[2:17:2])],
+        'raw_aux': list(vals[17:20]),
+        'stop_byte': vals[20],
+    }
 
 
 class Common:
@@ -84,9 +124,9 @@ class Common:
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-firmware-v300-new-commands-sample-rate
         http://docs.openbci.com/OpenBCI%20Software/06-OpenBCI_Ganglion_SDK#openbci-ganglion-sdk-firmware-v2xx-new-commands-sample-rate
         """
-        vals = [b'6', b'5', b'4', b'3', b'2', b'1', b'0']
-        if sample_rate not in vals:
-            raise ValueError('Sample rate must be one of %s' % vals)
+        if sample_rate not in _SAMPLE_RATE_CODES:
+            raise ValueError(
+                'Sample rate must be one of %s' % (_SAMPLE_RATE_CODES, ))
         self._serial.write(b'~' + sample_rate)
 
     def attach_wifi(self):
@@ -147,12 +187,10 @@ class Common:
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-16-channel-commands-turn-channels-on
         http://docs.openbci.com/OpenBCI%20Software/06-OpenBCI_Ganglion_SDK#openbci-ganglion-sdk-command-set-turn-channels-on
         """
-        vals = [
-            b'!', b'@', b'#', b'$', b'%', b'^', b'&', b'*',
-            b'Q', b'W', b'E', b'R', b'T', b'Y', b'U', b'I',
-        ]
-        if channel not in vals:
-            raise ValueError('`channel` value must be one of %s' % vals)
+        if channel not in ENABLE_CHANNEL_COMMANDS:
+            raise ValueError(
+                '`channel` value must be one of %s'
+                % (ENABLE_CHANNEL_COMMANDS, ))
         self._serial.write(channel)
 
     def disable_channel(self, channel):
@@ -173,12 +211,10 @@ class Common:
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-16-channel-commands-turn-channels-off
         http://docs.openbci.com/OpenBCI%20Software/06-OpenBCI_Ganglion_SDK#openbci-ganglion-sdk-command-set-turn-channels-off
         """
-        command = [
-            b'1', b'2', b'3', b'4', b'5', b'6', b'7', b'8',
-            b'q', b'w', b'e', b'r', b't', b'y', b'u', b'i',
-        ]
-        if channel not in command:
-            raise ValueError('`channel` value must be one of %s' % command)
+        if channel not in DISABLE_CHANNEL_COMMANDS:
+            raise ValueError(
+                '`channel` value must be one of %s'
+                % (DISABLE_CHANNEL_COMMANDS, ))
         self._serial.write(channel)
 
     def start_streaming(self):
@@ -203,10 +239,18 @@ class Common:
 
 
 class CytonBoard(Common):
-    """Stateless interface to Cyton"""
+    """Stateless interface to Cyton
+
+    The only state held is the buffer of streamed bytes which are read
+    from serial but not parsed yet.
+    """
 
     START_BYTE = 0xA0
 
+    def __init__(self, serial):
+        super().__init__(serial)
+        self._buffer = bytearray()
+
     def query_firmware_version(self):
         """Query firmware version. Message must be read separately.
 
@@ -237,9 +281,9 @@ class CytonBoard(Common):
         ----------
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-firmware-v300-new-commands-board-mode
         """
-        vals = [b'0', b'1', b'2', b'3', b'4']
-        if mode not in vals:
-            raise ValueError('Board mode must be one of %s' % vals)
+        if mode not in _BOARD_MODE_CODES:
+            raise ValueError(
+                'Board mode must be one of %s' % (_BOARD_MODE_CODES, ))
         self._serial.write(b'/' + mode)
 
     def attach_daisy(self):
@@ -319,6 +363,37 @@ class CytonBoard(Common):
         """
         self._serial.write(b'D')
 
+    def start_streaming(self):
+        """Start streaming data.
+
+        Data remaining in the stream buffer is discarded.
+
+        References
+        ----------
+        http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-command-set-stream-data-commands
+        """
+        del self._buffer[:]
+        super().start_streaming()
+
+    def _fill_buffer(self, size):
+        """Read from serial until the buffer has ``size`` bytes.
+
+        Everything already available in the serial input is read at once,
+        so that subsequent packets are served from the buffer.
+
+        Returns
+        -------
+        bool
+            False if time out occurred before ``size`` bytes are buffered.
+        """
+        buffer, serial = self._buffer, self._serial
+        while len(buffer) < size:
+            chunk = serial.read(max(size - len(buffer), serial.in_waiting))
+            if not chunk:
+                return False
+            buffer.extend(chunk)
+        return True
+
     def wait_start_byte(self):
         """Keep reading data until start byte is found.
 
@@ -328,44 +403,100 @@ class CytonBoard(Common):
         """
         n_skipped = 0
         while True:
-            val = self._serial.read()
-            if not val:
+            index = self._buffer.find(self.START_BYTE)
+            if index >= 0:
+                n_skipped += index
+                del self._buffer[:index + 1]
+                break
+            n_skipped += len(self._buffer)
+            del self._buffer[:]
+            if not self._fill_buffer(1):
                 raise exception.SampleAcquisitionTimeout(
                     'Time out occurred while waiting for a start byte.')
-            if struct.unpack('B', val)[0] == self.START_BYTE:
-                break
-            n_skipped += 1
         if n_skipped:
             _LG.warning('Skipped %d bytes at start.', n_skipped)
 
     def read_packet(self):
         """Read 32 byte packet.
 
+        The whole packet is read at once, then decoded in memory.
+        If the byte at the stop byte position is not in the range of
+        ``0xC0`` - ``0xCF``, the packet is deemed out of sync. Then only
+        the start byte is discarded and the next start byte is searched
+        from the buffered data.
+
+        Raises
+        ------
+        :class:`SampleAcquisitionTimeout<openbci_interface.exception.SampleAcquisitionTimeout>`
+            Time out occurs before the whole packet is received.
+
         References
         ----------
         http://docs.openbci.com/Hardware/03-Cyton_Data_Format#cyton-data-format-binary-format
         """
-        packet_id = self._read_packet_id()
-        raw_eeg = self._read_eeg_data()
-        raw_aux = self._read_aux_data()
-        stop_byte = self._read_stop_byte()
-        return {
-            'packet_id': packet_id,
-            'raw_eeg': raw_eeg,
-            'raw_aux': raw_aux,
-            'stop_byte': stop_byte,
-        }
-
-    def _read_packet_id(self):
-        return struct.unpack('B', self._serial.read())[0]
-
-    def _read_eeg_data(self):
-        return [
-            _interpret_24bit_as_int32(self._serial.read(3)) for _ in range(8)]
-
-    def _read_aux_data(self):
-        return [
-            _interpret_16bit_as_int32(self._serial.read(2)) for _ in range(3)]
-
-    def _read_stop_byte(self):
-        return struct.unpack('B', self._serial.read())[0]
+        while True:
+            if not self._fill_buffer(_PACKET.size):
+                raise exception.SampleAcquisitionTimeout(
+                    'Time out occurred while reading a packet.')
+            stop_byte = self._buffer[_PACKET.size - 1]
+            if stop_byte & 0xF0 == 0xC0:
+                break
+            _LG.warning('Unexpected stop byte 0x%02X; Re-syncing.', stop_byte)
+            self.wait_start_byte()
+        # Decode directly from the buffer without slicing out a copy.
+        # No view on the buffer may outlive this call, as that would
+        # prevent the buffer from being resized.
+        packet = _unpack_packet(self._buffer)
+        del self._buffer[:_PACKET.size]
+        return packet
+
+    def read_packets(self, n_packets):
+        """Read consecutive 32 byte packets.
+
+        Same as :func:`read_packet`, this method must be called after the
+        start byte of the first packet is consumed.
+        When the buffered stream is in sync, that is, every packet ends
+        with a valid stop byte and is followed by a start byte, the
+        packets are decoded at once. Otherwise they are read one by one
+        with :func:`wait_start_byte` and :func:`read_packet`.
+
+        Parameters
+        ----------
+        n_packets : int
+            The number of packets to read.
+
+        Returns
+        -------
+        list of dict
+            Packets in the same format as :func:`read_packet`.
+
+        Raises
+        ------
+        :class:`SampleAcquisitionTimeout<openbci_interface.exception.SampleAcquisitionTimeout>`
+            Time out occurs before all the packets are received.
+        """
+        if n_packets < 1:
+            return []
+        size = _FRAME.size * (n_packets - 1)
+        if (
+                n_packets > 1 and
+                self._fill_buffer(size + _PACKET.size) and
+                self._is_in_sync(size)
+        ):
+            raw = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            packets = [_to_packet(vals) for vals in _FRAME.iter_unpack(raw)]
+            packets.append(self.read_packet())
+            return packets
+        packets = [self.read_packet()]
+        for _ in range(n_packets - 1):
+            self.wait_start_byte()
+            packets.append(self.read_packet())
+        return packets
+
+    def _is_in_sync(self, size):
+        buffer = self._buffer
+        return all(
+            buffer[i] & 0xF0 == 0xC0 and buffer[i + 1] == self.START_BYTE
+            for i in range(_PACKET.size - 1, size, _FRAME.size)
+        )
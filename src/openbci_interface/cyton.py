@@ -4,7 +4,13 @@ import time
 import logging
 import warnings
 
-from openbci_interface.core import CytonBoard
+from openbci_interface.core import (
+    CytonBoard,
+    ENABLE_CHANNEL_COMMANDS,
+    DISABLE_CHANNEL_COMMANDS,
+    SAMPLE_RATE_COMMANDS,
+    BOARD_MODE_COMMANDS,
+)
 from openbci_interface import util, channel_config
 
 _LG = logging.getLogger(__name__)
@@ -14,10 +20,13 @@ STOP_BYTE = 0xC0
 ADS1299VREF = 4.5
 AUX_SCALE = 0.002 / pow(2, 4)
 
+_SAMPLE_RATE_PATTERN = re.compile(r'.*\s(\d+)\s*Hz\$\$\$')
+_BOARD_MODE_PATTERN = re.compile(r'.*\s(\S+)\$\$\$')
+_NUM_CHANNELS_PATTERN = re.compile(r'[\D]*(\d{1,2})\$\$\$')
+
 
 def _parse_sample_rate(message):
-    pattern = r'.*\s(\d+)\s*Hz\$\$\$'
-    matched = re.match(pattern, message)
+    matched = _SAMPLE_RATE_PATTERN.match(message)
     ret = None
     if matched:
         ret = int(matched.group(1))
@@ -27,8 +36,7 @@ def _parse_sample_rate(message):
 
 
 def _parse_board_mode(message):
-    pattern = r'.*\s(\S+)\$\$\$'
-    matched = re.match(pattern, message)
+    matched = _BOARD_MODE_PATTERN.match(message)
     ret = None
     if matched:
         ret = matched.group(1)
@@ -49,14 +57,6 @@ def _get_eeg_scale(gain):
     return 1000000. * ADS1299VREF / gain / (pow(2, 23) - 1)
 
 
-def _parse_eeg(raw_eeg, gain=None):
-    if gain is None:
-        warnings.warn('Gain value is not explicitly set. Using 24.')
-        gain = 24
-    scale = _get_eeg_scale(gain)
-    return raw_eeg * scale
-
-
 class Cyton:
     """Interface to Cyton board.
 
@@ -149,6 +149,10 @@ class Cyton:
             channel_config.ChannelConfig(i) for i in range(16)]
         self.daisy_attached = False
 
+        # EEG scale factor of each channel, derived from `channel_configs`
+        self._eeg_scales = None
+        self._update_eeg_scales()
+
     @property
     def cycle(self):
         """Time (in sec) to take one sample acquisition over all channels"""
@@ -176,14 +180,25 @@ class Cyton:
         :class:`DeviceNotConnected<openbci_interface.exception.DeviceNotConnected>`
             Serial connection is working, but no board is avaialable.
         """
+        msg = self._read_message_raw().decode('utf-8', errors='ignore')
+        if _LG.isEnabledFor(logging.INFO):
+            for line in msg.split('\n'):
+                _LG.info('   %s', line)
+        return msg
+
+    def _read_message_raw(self):
+        """Read and validate message without decoding it."""
         msg = self._board.read_message()
         _LG.debug('    %s', msg)
-        msg = msg.decode('utf-8', errors='ignore')
         util.validate_message(msg)
-        for line in msg.split('\n'):
-            _LG.info('   %s', line)
         return msg
 
+    def _check_failure(self):
+        """Read message and raise RuntimeError if it reports failure."""
+        msg = self._read_message_raw()
+        if b'failure' in msg.lower():
+            raise RuntimeError(msg.decode('utf-8', errors='ignore'))
+
     def reset_board(self):
         """Reset the board state.
 
@@ -245,16 +260,10 @@ class Cyton:
         """
         _LG.info('Setting board mode: %s', mode)
         mode = mode.lower()
-        vals = {
-            'default': b'0',
-            'debug': b'1',
-            'analog': b'2',
-            'digital': b'3',
-            'marker': b'4',
-        }
-        if mode not in vals:
-            raise ValueError('Board mode must be one of %s' % vals.keys())
-        self._board.set_board_mode(vals[mode])
+        if mode not in BOARD_MODE_COMMANDS:
+            raise ValueError(
+                'Board mode must be one of %s' % list(BOARD_MODE_COMMANDS))
+        self._board.set_board_mode(BOARD_MODE_COMMANDS[mode])
         self.board_mode = _parse_board_mode(self.read_message())
 
     def attach_daisy(self):
@@ -276,8 +285,7 @@ class Cyton:
             return
         self._board.attach_daisy()
         message = self.read_message()
-        pattern = r'[\D]*(\d{1,2})\$\$\$'
-        n_channels = int(re.search(pattern, message).group(1))
+        n_channels = int(_NUM_CHANNELS_PATTERN.search(message).group(1))
         self.daisy_attached = n_channels == 16
 
     def detach_daisy(self):
@@ -349,13 +357,10 @@ class Cyton:
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-firmware-v300-new-commands-sample-rate
         """
         _LG.info('Setting sample rate: %s', sample_rate)
-        vals = {
-            250: b'6', 500: b'5', 1000: b'4',
-            2000: b'3', 4000: b'2', 8000: b'1', 16000: b'0',
-        }
-        if sample_rate not in vals:
-            raise ValueError('Sample rate must be one of %s' % vals.keys())
-        self._board.set_sample_rate(vals[sample_rate])
+        if sample_rate not in SAMPLE_RATE_COMMANDS:
+            raise ValueError(
+                'Sample rate must be one of %s' % list(SAMPLE_RATE_COMMANDS))
+        self._board.set_sample_rate(SAMPLE_RATE_COMMANDS[sample_rate])
         message = self.read_message()
         self.sample_rate = _parse_sample_rate(message)
         return self.sample_rate
@@ -379,9 +384,7 @@ class Cyton:
             return
         _LG.info('Attaching WiFi shield...')
         self._board.attach_wifi()
-        message = self.read_message()
-        if 'failure' in message.lower():
-            raise RuntimeError(message)
+        self._check_failure()
         self.wifi_attached = True
 
     def detach_wifi(self):
@@ -407,9 +410,7 @@ class Cyton:
             return
         _LG.info('Detaching WiFi shield...')
         self._board.detach_wifi()
-        message = self.read_message()
-        if 'failure' in message.lower():
-            raise RuntimeError(message)
+        self._check_failure()
         self.wifi_attached = False
 
     def get_wifi_status(self):
@@ -460,16 +461,10 @@ class Cyton:
         ----------
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-16-channel-commands-turn-channels-on
         """
-        command = {
-            1: b'!', 2: b'@', 3: b'#', 4: b'$',
-            5: b'%', 6: b'^', 7: b'&', 8: b'*',
-            9: b'Q', 10: b'W', 11: b'E', 12: b'R',
-            13: b'T', 14: b'Y', 15: b'U', 16: b'I',
-        }
-        if channel not in command:
-            raise ValueError('`channel` value must be in range of [1, 8]')
+        if channel not in range(1, 17):
+            raise ValueError('`channel` value must be in range of [1, 16]')
         _LG.info('Enabling channel: %s', channel)
-        self._board.enable_channel(command[channel])
+        self._board.enable_channel(ENABLE_CHANNEL_COMMANDS[channel-1])
         self.channel_configs[channel-1].enabled = True
 
     def disable_channel(self, channel):
@@ -478,22 +473,16 @@ class Cyton:
         Parameters
         ----------
         channel : int
-            value must be between 1 - 8, inclusive.
+            value must be between 1 - 16, inclusive.
 
         References
         ----------
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-16-channel-commands-turn-channels-off
         """
-        command = {
-            1: b'1', 2: b'2', 3: b'3', 4: b'4',
-            5: b'5', 6: b'6', 7: b'7', 8: b'8',
-            9: b'q', 10: b'w', 11: b'e', 12: b'r',
-            13: b't', 14: b'y', 15: b'u', 16: b'i',
-        }
-        if channel not in command:
-            raise ValueError('`channel` value must be in range of [1, 8]')
+        if channel not in range(1, 17):
+            raise ValueError('`channel` value must be in range of [1, 16]')
         _LG.info('Disabling channel: %s', channel)
-        self._board.disable_channel(command[channel])
+        self._board.disable_channel(DISABLE_CHANNEL_COMMANDS[channel-1])
         self.channel_configs[channel-1].enabled = False
 
     def configure_channel(
@@ -543,19 +532,28 @@ class Cyton:
             power_down=power_down, gain=gain,
             input_type=input_type, bias=bias, srb2=srb2, srb1=srb1,
         )
+        self._update_eeg_scales()
         if not self.streaming or self.wifi_attached:
-            message = self.read_message()
-            if 'failure' in message.lower():
-                raise RuntimeError(message)
+            self._check_failure()
 
     def start_streaming(self):
         """Start streaming data.
 
+        EEG values of the following samples are scaled with the gain
+        values found in ``channel_configs`` at this point.
+
         References
         ----------
         http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-command-set-stream-data-commands
         """
         _LG.info('Start streaming.')
+        configs = self.channel_configs[:self.num_eeg]
+        unset = [cfg.channel + 1 for cfg in configs if cfg.gain is None]
+        if unset:
+            warnings.warn(
+                'Gain value is not explicitly set for channel %s. Using 24.'
+                % unset)
+        self._update_eeg_scales()
         self._board.start_streaming()
         self.streaming = True
         if self.wifi_attached:
@@ -723,15 +721,27 @@ class Cyton:
                }
 
 
-            ``valid`` is True when received stop byte matches 0xC0.
-            When ``valid`` is False, the sample acquisition was out of sync,
-            and values are not reliable.
+            ``valid`` is True when received stop byte is 0xC0
+            (standard with accel). Stop bytes 0xC1 - 0xCF are valid packet
+            formats whose AUX data is not interpreted, and ``valid`` is
+            False for them.
+
+            ``timestamp`` is the time (in sec since epoch) the sample was
+            received. It is measured with the monotonic clock, offset to
+            wall-clock time once at construction, so it does not jump
+            when the system clock is adjusted.
 
 
         .. note::
             This method will discard the message received from board
             before receiving start byte.
 
+        .. note::
+            Packets whose stop byte is not in the range of 0xC0 - 0xCF
+            are out of sync. They are skipped, with a warning logged, and
+            the next start byte is searched. Such packets are never
+            returned.
+
         .. note::
            The output format is subject to change.
 
@@ -742,34 +752,128 @@ class Cyton:
         Raises
         ------
         openbci_interface.exception.SampleAcquisitionTimeout
-            If time out occurs while waiting for a start byte.
+            If time out occurs while waiting for a start byte, or before
+            the whole packet is received.
 
         References
         ----------
         http://docs.openbci.com/Hardware/03-Cyton_Data_Format#cyton-data-format-binary-format
         """
-        sample = self._read_packet()
+        sample = self._read_sample()
+        sample['timestamp'] = self._time_offset + time.monotonic()
+        return sample
+
+    def read_samples(self, n_samples, precise_timestamps=False):
+        """Read multiple samples from channels.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of samples to read.
+
+        precise_timestamps : bool
+            If True, the clock is read after each sample is received,
+            as in :func:`read_sample`. Otherwise the clock is read once
+            after the last sample is received, and the timestamps of the
+            preceding samples are derived from it with :func:`cycle`.
+            The latter requires ``sample_rate`` to be known, so
+            per-sample timestamps are used when it is not.
+
+        Returns
+        -------
+        dict
+            Samples in column-wise layout. Each value is a list of
+            ``n_samples`` items, holding the value of the same key
+            returned by :func:`read_sample`, in acquisition order.
+            Packets out of sync are skipped as in :func:`read_sample`.
+
+            .. code-block:: javascript
+
+               {
+                 "eeg": [[<channel1>, ..., <channelN>], ...],
+                 "aux": [[<channel1>, ..., <channel3>], ...],
+                 "raw_eeg": [[<channel1>, ..., <channelN>], ...],
+                 "raw_aux": [[<channel1>, ..., <channel3>], ...],
+                 "packet_id": [int, ...],
+                 "timestamp": [float, ...],
+                 "valid": [bool, ...]
+               }
+
+        Raises
+        ------
+        openbci_interface.exception.SampleAcquisitionTimeout
+            If time out occurs while waiting for a start byte, or before
+            the whole packet is received.
+        """
+        if self.sample_rate is None:
+            precise_timestamps = True
+        keys = ['eeg', 'aux', 'raw_eeg', 'raw_aux', 'packet_id', 'valid']
+        if precise_timestamps:
+            keys.append('timestamp')
+            samples = (self.read_sample() for _ in range(n_samples))
+        else:
+            samples = self._read_samples(n_samples)
+        columns = [[] for _ in keys]
+        for sample in samples:
+            for key, column in zip(keys, columns):
+                column.append(sample[key])
+        samples = dict(zip(keys, columns))
+        if not precise_timestamps:
+            last = self._time_offset + time.monotonic()
+            cycle = self.cycle
+            samples['timestamp'] = [
+                last - (n_samples - 1 - i) * cycle for i in range(n_samples)]
+        return samples
+
+    def _read_samples(self, n_samples):
+        if n_samples < 1:
+            return []
+        n_packets = n_samples * (2 if self.daisy_attached else 1)
+        self._board.wait_start_byte()
+        packets = iter(self._board.read_packets(n_packets))
         if self.daisy_attached:
-            sample2 = self._read_packet()
+            return [
+                self._to_sample(packet, packet2)
+                for packet, packet2 in zip(packets, packets)
+            ]
+        return [self._to_sample(packet) for packet in packets]
+
+    def _read_sample(self):
+        packet = self._read_packet()
+        packet2 = self._read_packet() if self.daisy_attached else None
+        return self._to_sample(packet, packet2)
+
+    def _read_packet(self):
+        self._board.wait_start_byte()
+        return self._board.read_packet()
+
+    def _to_sample(self, packet, packet2=None):
+        sample = self._parse_packet(packet)
+        if packet2 is not None:
+            sample2 = self._parse_packet(packet2, offset=8)
             sample['eeg'].extend(sample2['eeg'])
             sample['raw_eeg'].extend(sample2['raw_eeg'])
             sample['valid'] = sample['valid'] and sample2['valid']
-        sample['timestamp'] = self._time_offset + time.monotonic()
         return sample
 
-    def _read_packet(self):
-        self._board.wait_start_byte()
-        data = self._board.read_packet()
-        data['eeg'] = self._parse_eeg(data['raw_eeg'])
-        data['aux'] = _parse_aux(data['stop_byte'], data['raw_aux'])
-        data['valid'] = data['stop_byte'] == STOP_BYTE
-        return {k: v for k, v in data.items() if k not in ['stop_byte']}
+    def _parse_packet(self, data, offset=0):
+        stop_byte = data.pop('stop_byte')
+        data['eeg'] = self._parse_eeg(data['raw_eeg'], offset)
+        data['aux'] = _parse_aux(stop_byte, data['raw_aux'])
+        data['valid'] = stop_byte == STOP_BYTE
+        return data
+
+    def _update_eeg_scales(self):
+        # Gains are looked up once here instead of for each sample.
+        self._eeg_scales = [
+            _get_eeg_scale(24 if cfg.gain is None else cfg.gain)
+            for cfg in self.channel_configs
+        ]
 
-    def _parse_eeg(self, raw_eeg_data):
+    def _parse_eeg(self, raw_eeg_data, offset=0):
+        scales = self._eeg_scales[offset:offset+8]
         return [
-            _parse_eeg(raw_eeg, self.channel_configs[i].gain)
-            for i, raw_eeg in enumerate(raw_eeg_data)
-        ]
+            raw_eeg * scale for raw_eeg, scale in zip(raw_eeg_data, scales)]
 
     ###########################################################################
     # Higher level function
@@ -1,6 +1,9 @@
 """Module to implement utility functions."""
 import re
+import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import serial
 import serial.tools.list_ports
@@ -9,15 +12,101 @@ from openbci_interface import exception
 
 _LG = logging.getLogger(__name__)
 
+# Sentinels in messages from the board, as bytes and as str.
+_END_OF_MESSAGE = b'$$$'
+_POLL_FAILURE = b'Device failed to poll Host'
+_END_OF_MESSAGE_STR = _END_OF_MESSAGE.decode()
+_POLL_FAILURE_STR = _POLL_FAILURE.decode()
+
+# USB VID/PID of the FTDI FT231X chip on the OpenBCI USB dongle.
+_DONGLE_VID_PID = (0x0403, 0x6015)
+# Read timeout for the ports of the dongle, which replies quickly.
+_DONGLE_TIMEOUT = 0.5
+
+# Firmware strings recently read, keyed by (port, timeout).
+_FIRMWARE_CACHE = {}
+_FIRMWARE_CACHE_TTL = 5.0
+
+
+def clear_firmware_cache():
+    """Clear firmware strings cached by :func:`list_devices`.
+
+    Firmware strings are cached for a few seconds so that repeated calls
+    of :func:`list_devices` do not query the same ports again.
+    """
+    _FIRMWARE_CACHE.clear()
+
 
 def _get_firmware_string(port, timeout=2):
+    key = (port, timeout)
+    cached = _FIRMWARE_CACHE.get(key)
+    if cached is not None:
+        read_at, msg = cached
+        if time.monotonic() - read_at < _FIRMWARE_CACHE_TTL:
+            return msg
+    msg = _read_firmware_string(port, timeout)
+    _FIRMWARE_CACHE[key] = (time.monotonic(), msg)
+    return msg
+
+
+def _read_firmware_string(port, timeout):
     _LG.debug('Checking port: %s', port)
     with serial.Serial(port=port, baudrate=115200, timeout=timeout) as ser:
         ser.write(b'v')
-        return ser.read_until(b'$$$').decode('utf-8', errors='ignore')
+        buffer, start = bytearray(), 0
+        # The read timeout is left as is, because setting it reconfigures
+        # the port. The deadline is checked between reads to stop a board
+        # that keeps trickling bytes. A read started just before the
+        # deadline can still wait for the full timeout, so a probe takes
+        # up to about twice the timeout.
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            chunk = ser.read(max(1, ser.in_waiting))
+            if not chunk:
+                break
+            buffer.extend(chunk)
+            # Search only the new bytes and the tail of the previous ones,
+            # which can hold the beginning of the sentinel.
+            index = buffer.find(_END_OF_MESSAGE, start)
+            if index >= 0:
+                del buffer[index + len(_END_OF_MESSAGE):]
+                break
+            start = max(0, len(buffer) - len(_END_OF_MESSAGE) + 1)
+        return bytes(buffer)
+
+
+def _compile_filter(filter_regex):
+    # Firmware strings are matched as bytes, without decoding.
+    # Plain literals, such as the default ``OpenBCI``, are matched with
+    # substring search instead of the regular expression engine.
+    pattern = filter_regex.encode('utf-8')
+    if re.escape(filter_regex) == filter_regex:
+        return lambda msg: pattern in msg
+    return re.compile(pattern).search
+
 
+def _unique_ports(ports):
+    # On macOS, a USB serial device can show up as both `/dev/tty.*` and
+    # `/dev/cu.*`. Skip the `tty` one, as `cu` does not wait for carrier
+    # detect on open. Ports are not matched by serial number, since all the
+    # interfaces of a multi-port chip share one.
+    if sys.platform != 'darwin':
+        return list(ports)
+    devices = {port.device for port in ports}
+    unique = []
+    for port in ports:
+        name = port.device
+        if (
+                name.startswith('/dev/tty.') and
+                '/dev/cu.' + name[len('/dev/tty.'):] in devices
+        ):
+            _LG.debug('Skipping alias port: %s', name)
+            continue
+        unique.append(port)
+    return unique
 
-def list_devices(filter_regex='OpenBCI', timeout=2):
+
+def list_devices(filter_regex='OpenBCI', timeout=2, strict_vid=False):
     """List OpenBCI devices by querying COM ports.
 
     Parameters
@@ -26,35 +115,81 @@ def list_devices(filter_regex='OpenBCI', timeout=2):
         Regular expression applied to firmware information string,
         using ``re.search`` function. To get only Cyton boards, you can
         use ``ADS1299``. To get only Ganglion, you can use ``Gangion``.
+        The pattern is encoded to UTF-8 and matched against raw bytes.
 
     timeout : float
-        Read timeout
+        Read timeout. Ports with the USB VID/PID of OpenBCI dongle
+        (``0403:6015``) are read with timeout of 0.5 seconds, or this
+        value if it is shorter.
+
+    strict_vid : bool
+        If True, only the ports with the USB VID/PID of OpenBCI dongle
+        are queried, unless no such port is found, in which case all the
+        ports are queried. This is faster when other serial devices are
+        connected, but misses boards behind other USB serial chips.
+        Default: False, all the ports are queried.
 
     Yields
     ------
     str
         Name of the device found.
+
+    Notes
+    -----
+    Ports are queried concurrently, so devices are yielded in the order
+    they respond, not in the order of ``comports``.
+
+    Firmware strings are cached for 5 seconds. Use
+    :func:`clear_firmware_cache` to query the ports again right away.
     """
-    devices = [p.device for p in serial.tools.list_ports.comports()]
-    _LG.info('Found %d COM ports. %s', len(devices), devices)
-    for device in devices:
-        msg = _get_firmware_string(device, timeout=timeout)
-        if 'Device failed to poll Host' in msg:
-            _LG.error(
-                'Found USB dongle at "%s", '
-                'but it failed to poll message from a board; %s',
-                device, repr(msg)
-            )
-        elif re.search(filter_regex, msg):
-            _LG.info('Matched   [%s] %s "%s"', filter_regex, device, msg)
-            yield device
-        else:
-            _LG.info('Unmatched [%s] %s "%s"', filter_regex, device, msg)
+    match = _compile_filter(filter_regex)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures, others = {}, []
+
+        def _probe(device, timeout):
+            future = executor.submit(_get_firmware_string, device, timeout)
+            futures[future] = device
+
+        for port in _unique_ports(serial.tools.list_ports.comports()):
+            if (port.vid, port.pid) == _DONGLE_VID_PID:
+                _probe(port.device, min(timeout, _DONGLE_TIMEOUT))
+            elif strict_vid:
+                others.append(port.device)
+            else:
+                _probe(port.device, timeout)
+        if not futures:
+            for device in others:
+                _probe(device, timeout)
+        if _LG.isEnabledFor(logging.INFO):
+            _LG.info(
+                'Querying %d COM ports. %s',
+                len(futures), list(futures.values()))
+        for future in as_completed(futures):
+            device = futures[future]
+            msg = future.result()
+            _LG.debug('Message from %s: %r', device, msg)
+            if _POLL_FAILURE in msg:
+                _LG.error(
+                    'Found USB dongle at "%s", '
+                    'but it failed to poll message from a board; %r',
+                    device, _to_str(msg)
+                )
+            elif match(msg):
+                _LG.info('Matched   [%s] %s', filter_regex, device)
+                yield device
+            else:
+                _LG.info('Unmatched [%s] %s', filter_regex, device)
 
 
 def validate_message(message):
     """Validate message received from serial.
 
+    Parameters
+    ----------
+    message : str or bytes
+        Message received from the board. ``bytes`` is validated as-is,
+        without decoding.
+
     Raises
     ------
     :class:`UnexpectedMessageFormat<openbci_interface.exception.UnexpectedMessageFormat>`
@@ -63,7 +198,17 @@ def validate_message(message):
     :class:`DeviceNotConnected<openbci_interface.exception.DeviceNotConnected>`
         Serial connection is working, but no board is avaialable.
     """
-    if not message.endswith('$$$'):
-        raise exception.UnexpectedMessageFormat(message)
-    if 'Device failed to poll Host' in message:
-        raise exception.DeviceNotConnected(message)
+    if isinstance(message, bytes):
+        terminator, failure = _END_OF_MESSAGE, _POLL_FAILURE
+    else:
+        terminator, failure = _END_OF_MESSAGE_STR, _POLL_FAILURE_STR
+    if not message.endswith(terminator):
+        raise exception.UnexpectedMessageFormat(_to_str(message))
+    if failure in message:
+        raise exception.DeviceNotConnected(_to_str(message))
+
+
+def _to_str(message):
+    if isinstance(message, bytes):
+        return message.decode('utf-8', errors='ignore')
+    return message
@@ -0,0 +1,20 @@
+"""Define fixtures for testing commands"""
+import pytest
+
+from tests import messages
+from tests.patterns import build_packet, BOARD_SETUP, CHANNEL_SETUP_8
+
+
+@pytest.fixture(scope='session')
+def stream_patterns():
+    """I/O patterns of initializing Cyton and streaming one packet"""
+    return (
+        (b'v', messages.CYTON_V3_INFO),
+        (b'V', b'v3.1.1$$$'),
+        *BOARD_SETUP,
+        *CHANNEL_SETUP_8,
+        (b'/0', messages.BOARD_MODE_DEFAULT),
+        (b'~6', messages.SAMPLE_RATE_250),
+        (b'b', build_packet(ord('w'))),
+        (b's', None),
+    )
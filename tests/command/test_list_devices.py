@@ -1,7 +1,7 @@
 from openbci_interface.command import list_devices
 
 
-def _lists(filter_regex=None):
+def _lists(filter_regex=None, strict_vid=False):
     return ['foo', 'bar']
 
 
@@ -10,9 +10,24 @@ _LG = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope='function')
-def cyton_mock():
-    """Instanciate Cyton with SerialMock and inspect buffer at tear down"""
+def cyton_mock(request):
+    """Instanciate Cyton with SerialMock and inspect buffer at tear down
+
+    Tests which deliberately leave a partial packet behind can be marked
+    with ``cyton_partial_packet`` to skip the check on board buffer.
+    """
     serial = SerialMock()
-    yield cyton.Cyton(serial)
+    board = cyton.Cyton(serial)
+    yield board
     serial.validate_no_message_in_buffer()
     serial.validate_all_patterns_consumed()
+    if request.node.get_closest_marker('cyton_partial_packet') is None:
+        _validate_no_data_in_board_buffer(board)
+
+
+def _validate_no_data_in_board_buffer(board):
+    """Validate that no bytes read from Serial are left unparsed"""
+    buffer = board._board._buffer
+    if buffer:
+        raise AssertionError(
+            'Un-parsed data found in board buffer; %s' % bytes(buffer))
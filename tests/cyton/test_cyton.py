@@ -3,11 +3,60 @@ import pytest
 from openbci_interface import cyton, exception
 
 from tests import messages
+from tests.patterns import (
+    build_packet, BOARD_SETUP, CHANNEL_SETUP_8, CHANNEL_SETUP_16)
 
 # pylint: disable=protected-access,invalid-name
 
 pytestmark = pytest.mark.cyton
 
+_SAMPLE_RATE_IDS = [
+    '%dHz' % rate for rate in [250, 500, 1000, 2000, 4000, 8000, 16000]]
+
+# Channel codes of `x (CHANNEL, POWER_DOWN, ...) X` command, channel 1 - 16
+_CHANNEL_CODES = tuple(bytes([c]) for c in b'12345678QWERTYUI')
+
+# (channel, command, enabled) cases of turning on/off channel 1 - 8.
+# Channels are turned off with the same code as channel setting command.
+_TOGGLE_CHANNEL_CASES = tuple(
+    (channel, bytes([code]), True)
+    for channel, code in enumerate(b'!@#$%^&*', start=1)
+) + tuple(
+    (channel, code, False)
+    for channel, code in enumerate(_CHANNEL_CODES[:8], start=1)
+)
+
+_SET_SAMPLE_RATE_CASES = (
+    (250, (b'~6', messages.SAMPLE_RATE_250)),
+    (500, (b'~5', messages.SAMPLE_RATE_500)),
+    (1000, (b'~4', messages.SAMPLE_RATE_1000)),
+    (2000, (b'~3', messages.SAMPLE_RATE_2000)),
+    (4000, (b'~2', messages.SAMPLE_RATE_4000)),
+    (8000, (b'~1', messages.SAMPLE_RATE_8000)),
+    (16000, (b'~0', messages.SAMPLE_RATE_16000)),
+)
+
+_SET_BOARD_MODE_CASES = (
+    ('default', (b'/0', messages.BOARD_MODE_DEFAULT)),
+    ('debug', (b'/1', messages.BOARD_MODE_DEBUG)),
+    ('analog', (b'/2', messages.BOARD_MODE_ANALOG)),
+    ('digital', (b'/3', messages.BOARD_MODE_DIGITAL)),
+    ('marker', (b'/4', messages.BOARD_MODE_MARKER)),
+)
+
+# Channel settings and their codes exercised by test_configure_channel.
+# Other values: power_down 'OFF' (b'1'), gain 1/2/4/6/8/12 (b'0' - b'5'),
+# input_type SHORTED/BIAS_MEAS/MVDD/TEMP/TESTSIG/BIAS_DRP/BIAS_DRN
+# (b'1' - b'7'), bias 0 (b'0'), srb2 0 (b'0') and srb1 1 (b'1').
+_CHANNEL_SETTINGS = (
+    'ON', b'0',
+    24, b'6',
+    'NORMAL', b'0',
+    1, b'1',
+    1, b'1',
+    0, b'0',
+)
+
 
 def test_attributes():
     """Cyton board has 8 EEG channels and 3 AUX channels"""
@@ -42,100 +91,42 @@ class TestCytonCommandSet:
     ###########################################################################
     # Turn on/off channel
     @staticmethod
-    @pytest.mark.parametrize('channel,command', [
-        (1, b'!'),
-        (2, b'@'),
-        (3, b'#'),
-        (4, b'$'),
-        (5, b'%'),
-        (6, b'^'),
-        (7, b'&'),
-        (8, b'*'),
-    ])
-    def test_enable_channel(cyton_mock, channel, command):
-        cyton_mock._serial.patterns = [(command, None)]
-        cyton_mock.enable_channel(channel)
-        assert cyton_mock.channel_configs[channel-1].enabled
-
-    @staticmethod
-    @pytest.mark.parametrize('channel,command', [
-        (1, b'1'),
-        (2, b'2'),
-        (3, b'3'),
-        (4, b'4'),
-        (5, b'5'),
-        (6, b'6'),
-        (7, b'7'),
-        (8, b'8'),
-    ])
-    def test_disable_channel(cyton_mock, channel, command):
+    @pytest.mark.parametrize(
+        'channel,command,enabled', _TOGGLE_CHANNEL_CASES, ids=(
+            ['enable-ch%d' % ch for ch in range(1, 9)] +
+            ['disable-ch%d' % ch for ch in range(1, 9)]
+        ))
+    def test_toggle_channel(cyton_mock, channel, command, enabled):
         cyton_mock._serial.patterns = [(command, None)]
-        cyton_mock.disable_channel(channel)
-        assert not cyton_mock.channel_configs[channel-1].enabled
+        if enabled:
+            cyton_mock.enable_channel(channel)
+        else:
+            cyton_mock.disable_channel(channel)
+        assert cyton_mock.channel_configs[channel-1].enabled is enabled
+
+    @staticmethod
+    @pytest.mark.parametrize('channel', [0, 17])
+    def test_toggle_channel_out_of_range(cyton_mock, channel):
+        cyton_mock._serial.patterns = []
+        with pytest.raises(ValueError):
+            cyton_mock.enable_channel(channel)
+        with pytest.raises(ValueError):
+            cyton_mock.disable_channel(channel)
 
     ###########################################################################
     # Configure Channel Command
     @staticmethod
     @pytest.mark.parametrize(
-        'channel,channel_code', [
-            (1, b'1'),
-            (2, b'2'),
-            (3, b'3'),
-            (4, b'4'),
-            (5, b'5'),
-            (6, b'6'),
-            (7, b'7'),
-            (8, b'8'),
-            (9, b'Q'),
-            (10, b'W'),
-            (11, b'E'),
-            (12, b'R'),
-            (13, b'T'),
-            (14, b'Y'),
-            (15, b'U'),
-            (16, b'I'),
-        ])
-    @pytest.mark.parametrize(
-        'power_down,power_down_code', [
-            ('ON', b'0'),
-            # ('OFF', b'1'),
-        ])
-    @pytest.mark.parametrize(
-        'gain,gain_code', [
-            # (1, b'0'),
-            # (2, b'1'),
-            # (4, b'2'),
-            # (6, b'3'),
-            # (8, b'4'),
-            # (12, b'5'),
-            (24, b'6'),
-        ])
-    @pytest.mark.parametrize(
-        'input_type,input_type_code', [
-            ('NORMAL', b'0'),
-            # ('SHORTED', b'1'),
-            # ('BIAS_MEAS', b'2'),
-            # ('MVDD', b'3'),
-            # ('TEMP', b'4'),
-            # ('TESTSIG', b'5'),
-            # ('BIAS_DRP', b'6'),
-            # ('BIAS_DRN', b'7'),
-        ])
-    @pytest.mark.parametrize(
-        'bias,bias_code', [
-            # (0, b'0'),
-            (1, b'1'),
-        ])
-    @pytest.mark.parametrize(
-        'srb2,srb2_code', [
-            # (0, b'0'),
-            (1, b'1'),
-        ])
-    @pytest.mark.parametrize(
+        'channel,channel_code,'
+        'power_down,power_down_code,'
+        'gain,gain_code,'
+        'input_type,input_type_code,'
+        'bias,bias_code,'
+        'srb2,srb2_code,'
         'srb1,srb1_code', [
-            (0, b'0'),
-            # (1, b'1'),
-        ])
+            (channel, channel_code) + _CHANNEL_SETTINGS
+            for channel, channel_code in enumerate(_CHANNEL_CODES, start=1)
+        ], ids=['ch%d' % ch for ch in range(1, 17)])
     def test_configure_channel(
             cyton_mock,
             channel, channel_code,
@@ -196,26 +187,27 @@ class TestCytonCommandSet:
     ###########################################################################
     # Streaming
     @staticmethod
-    def test_start_streaming(cyton_mock):
-        cyton_mock._serial.patterns = [(b'b', None)]
-        cyton_mock.start_streaming()
-
-    @staticmethod
-    def test_start_streaming_wifi(cyton_mock):
-        cyton_mock._serial.patterns = [(b'b', messages.STREAM_STARTED)]
-        cyton_mock.wifi_attached = True
+    @pytest.mark.parametrize('wifi_attached,message', [
+        (False, None),
+        (True, messages.STREAM_STARTED),
+    ])
+    def test_start_streaming(cyton_mock, wifi_attached, message):
+        cyton_mock._serial.patterns = [(b'b', message)]
+        cyton_mock.wifi_attached = wifi_attached
         cyton_mock.start_streaming()
+        assert cyton_mock.streaming
 
     @staticmethod
-    def test_stop_streaming(cyton_mock):
-        cyton_mock._serial.patterns = [(b's', None)]
-        cyton_mock.stop_streaming()
-
-    @staticmethod
-    def test_stop_streaming_wifi(cyton_mock):
-        cyton_mock._serial.patterns = [(b's', messages.STREAM_STOPPED)]
-        cyton_mock.wifi_attached = True
+    @pytest.mark.parametrize('wifi_attached,message', [
+        (False, None),
+        (True, messages.STREAM_STOPPED),
+    ])
+    def test_stop_streaming(cyton_mock, wifi_attached, message):
+        cyton_mock._serial.patterns = [(b's', message)]
+        cyton_mock.wifi_attached = wifi_attached
+        cyton_mock.streaming = True
         cyton_mock.stop_streaming()
+        assert not cyton_mock.streaming
 
     ###########################################################################
     # Misc
@@ -238,29 +230,17 @@ class TestCyton16ChannelCommandSet:
     http://docs.openbci.com/OpenBCI%20Software/04-OpenBCI_Cyton_SDK#openbci-cyton-sdk-16-channel-commands
     """
     @staticmethod
-    def test_attach_daisy_alread_attached(cyton_mock):
-        cyton_mock._serial.patterns = [(b'C', messages.DAISY_ALREADY_ATTACHED)]
-        cyton_mock.attach_daisy()
-        assert cyton_mock.daisy_attached
-
-    @staticmethod
-    def test_attach_daisy_attached(cyton_mock):
-        cyton_mock._serial.patterns = [(b'C', messages.DAISY_ATTACHED)]
-        cyton_mock.attach_daisy()
-        assert cyton_mock.daisy_attached
-
-    @staticmethod
-    def test_attach_daisy_not_attached(cyton_mock):
-        cyton_mock._serial.patterns = [(b'C', messages.NO_DAISY_TO_ATTACH)]
-        cyton_mock.attach_daisy()
-        assert not cyton_mock.daisy_attached
-
-    @staticmethod
-    def test_detach_daisy_present(cyton_mock):
-        cyton_mock._serial.patterns = [(b'c', messages.DAISY_REMOVED)]
-        cyton_mock.daisy_attached = True
-        cyton_mock.detach_daisy()
-        assert not cyton_mock.daisy_attached
+    @pytest.mark.parametrize('method,pattern,attached,expected', [
+        ('attach_daisy', (b'C', messages.DAISY_ALREADY_ATTACHED), False, True),
+        ('attach_daisy', (b'C', messages.DAISY_ATTACHED), False, True),
+        ('attach_daisy', (b'C', messages.NO_DAISY_TO_ATTACH), False, False),
+        ('detach_daisy', (b'c', messages.DAISY_REMOVED), True, False),
+    ])
+    def test_daisy_command(cyton_mock, method, pattern, attached, expected):
+        cyton_mock._serial.patterns = [pattern]
+        cyton_mock.daisy_attached = attached
+        getattr(cyton_mock, method)()
+        assert cyton_mock.daisy_attached is expected
 
     @staticmethod
     def test_detach_daisy_not_present(cyton_mock):
@@ -287,25 +267,23 @@ class TestCytonV2CommandSet:
     ###########################################################################
     # Timestamp
     @staticmethod
-    def test_enable_timestamp_streaming(cyton_mock):
-        cyton_mock._serial.patterns = [(b'<', None)]
-        cyton_mock.streaming = True
-        cyton_mock.enable_timestamp()
-
-    @staticmethod
-    def test_enable_timestamp(cyton_mock):
-        cyton_mock._serial.patterns = [(b'<', messages.TIMESTAMP_ON)]
+    @pytest.mark.parametrize('streaming,message', [
+        (True, None),
+        (False, messages.TIMESTAMP_ON),
+    ])
+    def test_enable_timestamp(cyton_mock, streaming, message):
+        cyton_mock._serial.patterns = [(b'<', message)]
+        cyton_mock.streaming = streaming
         cyton_mock.enable_timestamp()
 
     @staticmethod
-    def test_disable_timestamp_streaming(cyton_mock):
-        cyton_mock._serial.patterns = [(b'>', None)]
-        cyton_mock.streaming = True
-        cyton_mock.disable_timestamp()
-
-    @staticmethod
-    def test_disable_timestamp(cyton_mock):
-        cyton_mock._serial.patterns = [(b'>', messages.TIMESTAMP_OFF)]
+    @pytest.mark.parametrize('streaming,message', [
+        (True, None),
+        (False, messages.TIMESTAMP_OFF),
+    ])
+    def test_disable_timestamp(cyton_mock, streaming, message):
+        cyton_mock._serial.patterns = [(b'>', message)]
+        cyton_mock.streaming = streaming
         cyton_mock.disable_timestamp()
 
 
@@ -318,63 +296,77 @@ class TestCytonV3CommandSet:
     ###########################################################################
     # Sample Rate
     @staticmethod
-    @pytest.mark.parametrize('sample_rate', [
-        250, 500, 1000, 2000, 4000, 8000, 16000,
-    ])
-    def test_get_sample_rate(cyton_mock, sample_rate):
-        cyton_mock._serial.patterns = [
-            (b'~~', b'Success: Sample rate is %dHz$$$' % sample_rate)]
+    @pytest.mark.parametrize('sample_rate,message', [
+        (250, messages.SAMPLE_RATE_250),
+        (500, messages.SAMPLE_RATE_500),
+        (1000, messages.SAMPLE_RATE_1000),
+        (2000, messages.SAMPLE_RATE_2000),
+        (4000, messages.SAMPLE_RATE_4000),
+        (8000, messages.SAMPLE_RATE_8000),
+        (16000, messages.SAMPLE_RATE_16000),
+    ], ids=_SAMPLE_RATE_IDS)
+    def test_get_sample_rate(cyton_mock, sample_rate, message):
+        cyton_mock._serial.patterns = [(b'~~', message)]
         found = cyton_mock.get_sample_rate()
         assert found == sample_rate
 
     @staticmethod
-    @pytest.mark.parametrize('sample_rate,pattern', [
-        (250, (b'~6', messages.SAMPLE_RATE_250)),
-        (500, (b'~5', messages.SAMPLE_RATE_500)),
-        (1000, (b'~4', messages.SAMPLE_RATE_1000)),
-        (2000, (b'~3', messages.SAMPLE_RATE_2000)),
-        (4000, (b'~2', messages.SAMPLE_RATE_4000)),
-        (8000, (b'~1', messages.SAMPLE_RATE_8000)),
-        (16000, (b'~0', messages.SAMPLE_RATE_16000)),
-    ])
+    @pytest.mark.parametrize(
+        'sample_rate,pattern', _SET_SAMPLE_RATE_CASES, ids=_SAMPLE_RATE_IDS)
     def test_set_sample_rate(cyton_mock, sample_rate, pattern):
         cyton_mock._serial.patterns = [pattern]
         found = cyton_mock.set_sample_rate(sample_rate)
         assert found == sample_rate
 
+    @staticmethod
+    def test_set_sample_rate_invalid(cyton_mock):
+        cyton_mock._serial.patterns = []
+        with pytest.raises(ValueError):
+            cyton_mock.set_sample_rate(200)
+
     ###########################################################################
     # Board Mode
     @staticmethod
-    @pytest.mark.parametrize('mode', [
-        'default', 'debug', 'analog', 'digital', 'marker',
+    @pytest.mark.parametrize('mode,message', [
+        ('default', b'Board mode is default$$$'),
+        ('debug', b'Board mode is debug$$$'),
+        ('analog', b'Board mode is analog$$$'),
+        ('digital', b'Board mode is digital$$$'),
+        ('marker', b'Board mode is marker$$$'),
     ])
-    def test_get_board_mode(cyton_mock, mode):
-        cyton_mock._serial.patterns = [
-            (b'//', b'Board mode is %s$$$' % mode.encode('utf-8'))
-        ]
+    def test_get_board_mode(cyton_mock, mode, message):
+        cyton_mock._serial.patterns = [(b'//', message)]
         found = cyton_mock.get_board_mode()
         assert mode == found
 
     @staticmethod
-    @pytest.mark.parametrize('mode,pattern', [
-        ('default', (b'/0', messages.BOARD_MODE_DEFAULT)),
-        ('debug', (b'/1', messages.BOARD_MODE_DEBUG)),
-        ('analog', (b'/2', messages.BOARD_MODE_ANALOG)),
-        ('digital', (b'/3', messages.BOARD_MODE_DIGITAL)),
-        ('marker', (b'/4', messages.BOARD_MODE_MARKER)),
-    ])
+    @pytest.mark.parametrize('mode,pattern', _SET_BOARD_MODE_CASES)
     def test_set_board_mode(cyton_mock, mode, pattern):
         cyton_mock._serial.patterns = [pattern]
         cyton_mock.set_board_mode(mode)
         assert cyton_mock.board_mode == mode
 
+    @staticmethod
+    def test_set_board_mode_invalid(cyton_mock):
+        cyton_mock._serial.patterns = []
+        with pytest.raises(ValueError):
+            cyton_mock.set_board_mode('foo')
+
     ###########################################################################
     # WiFi
     @staticmethod
-    def test_attach_wifi_success(cyton_mock):
-        cyton_mock._serial.patterns = [(b'{', messages.WIFI_ATTACH_SUCCESS)]
-        cyton_mock.attach_wifi()
-        assert cyton_mock.wifi_attached
+    @pytest.mark.parametrize('method,pattern,attached,expected', [
+        ('attach_wifi', (b'{', messages.WIFI_ATTACH_SUCCESS), False, True),
+        ('detach_wifi', (b'}', messages.WIFI_REMOVE_SUCCESS), True, False),
+        ('get_wifi_status', (b':', messages.WIFI_PRESENT), False, True),
+        ('get_wifi_status', (b':', messages.WIFI_NOT_PRESENT), True, False),
+        ('reset_wifi', (b';', messages.WIFI_RESET), False, False),
+    ])
+    def test_wifi_command(cyton_mock, method, pattern, attached, expected):
+        cyton_mock._serial.patterns = [pattern]
+        cyton_mock.wifi_attached = attached
+        getattr(cyton_mock, method)()
+        assert cyton_mock.wifi_attached is expected
 
     @staticmethod
     def test_attach_wifi_failure(cyton_mock):
@@ -382,13 +374,6 @@ class TestCytonV3CommandSet:
         with pytest.raises(RuntimeError):
             cyton_mock.attach_wifi()
 
-    @staticmethod
-    def test_detach_wifi_success(cyton_mock):
-        cyton_mock._serial.patterns = [(b'}', messages.WIFI_REMOVE_SUCCESS)]
-        cyton_mock.wifi_attached = True
-        cyton_mock.detach_wifi()
-        assert not cyton_mock.wifi_attached
-
     @staticmethod
     def test_detach_wifi_failure(cyton_mock):
         cyton_mock._serial.patterns = [(b'}', messages.WIFI_REMOVE_FAILURE)]
@@ -397,25 +382,6 @@ class TestCytonV3CommandSet:
             cyton_mock.detach_wifi()
         assert cyton_mock.wifi_attached
 
-    @staticmethod
-    def test_get_wifi_status_present(cyton_mock):
-        cyton_mock._serial.patterns = [(b':', messages.WIFI_PRESENT)]
-        cyton_mock.wifi_attached = False
-        cyton_mock.get_wifi_status()
-        assert cyton_mock.wifi_attached
-
-    @staticmethod
-    def test_get_wifi_status_not_present(cyton_mock):
-        cyton_mock._serial.patterns = [(b':', messages.WIFI_NOT_PRESENT)]
-        cyton_mock.wifi_attached = True
-        cyton_mock.get_wifi_status()
-        assert not cyton_mock.wifi_attached
-
-    @staticmethod
-    def test_reset_wifi(cyton_mock):
-        cyton_mock._serial.patterns = [(b';', messages.WIFI_RESET)]
-        cyton_mock.reset_wifi()
-
     ###########################################################################
     # Others
     @staticmethod
@@ -434,17 +400,8 @@ class TestCytonContextManager:
         cyton_mock._serial.patterns = [
             (b'v', messages.CYTON_V3_INFO),
             (b'V', b'Firmware: v3.1.1$$$'),
-            (b'/0', messages.BOARD_MODE_DEFAULT),
-            (b'~6', messages.SAMPLE_RATE_250),
-            (b'D', b'060110$$$'),
-            (b'!', None), (b'x1060110X', messages.SET_CHANNEL_1),
-            (b'@', None), (b'x2060110X', messages.SET_CHANNEL_2),
-            (b'#', None), (b'x3060110X', messages.SET_CHANNEL_3),
-            (b'$', None), (b'x4060110X', messages.SET_CHANNEL_4),
-            (b'%', None), (b'x5060110X', messages.SET_CHANNEL_5),
-            (b'^', None), (b'x6060110X', messages.SET_CHANNEL_6),
-            (b'&', None), (b'x7060110X', messages.SET_CHANNEL_7),
-            (b'*', None), (b'x8060110X', messages.SET_CHANNEL_8),
+            *BOARD_SETUP,
+            *CHANNEL_SETUP_8,
         ]
         with cyton_mock:
             pass
@@ -455,17 +412,8 @@ class TestCytonContextManager:
         cyton_mock._serial.patterns = [
             (b'v', messages.CYTON_V3_INFO),
             (b'V', b'v3.1.1$$$'),
-            (b'/0', messages.BOARD_MODE_DEFAULT),
-            (b'~6', messages.SAMPLE_RATE_250),
-            (b'D', b'060110$$$'),
-            (b'!', None), (b'x1060110X', messages.SET_CHANNEL_1),
-            (b'@', None), (b'x2060110X', messages.SET_CHANNEL_2),
-            (b'#', None), (b'x3060110X', messages.SET_CHANNEL_3),
-            (b'$', None), (b'x4060110X', messages.SET_CHANNEL_4),
-            (b'%', None), (b'x5060110X', messages.SET_CHANNEL_5),
-            (b'^', None), (b'x6060110X', messages.SET_CHANNEL_6),
-            (b'&', None), (b'x7060110X', messages.SET_CHANNEL_7),
-            (b'*', None), (b'x8060110X', messages.SET_CHANNEL_8),
+            *BOARD_SETUP,
+            *CHANNEL_SETUP_8,
             (b'b', None),
             (b's', None),
         ]
@@ -478,171 +426,231 @@ class TestCytonContextManager:
         cyton_mock._serial.patterns = [
             (b'v', messages.CYTON_V3_WITH_DAISY_INFO),
             (b'V', b'v3.1.1$$$'),
-            (b'/0', messages.BOARD_MODE_DEFAULT),
-            (b'~6', messages.SAMPLE_RATE_250),
-            (b'D', b'060110$$$'),
-            (b'!', None), (b'x1060110X', messages.SET_CHANNEL_1),
-            (b'@', None), (b'x2060110X', messages.SET_CHANNEL_2),
-            (b'#', None), (b'x3060110X', messages.SET_CHANNEL_3),
-            (b'$', None), (b'x4060110X', messages.SET_CHANNEL_4),
-            (b'%', None), (b'x5060110X', messages.SET_CHANNEL_5),
-            (b'^', None), (b'x6060110X', messages.SET_CHANNEL_6),
-            (b'&', None), (b'x7060110X', messages.SET_CHANNEL_7),
-            (b'*', None), (b'x8060110X', messages.SET_CHANNEL_8),
-            (b'Q', None), (b'xQ060110X', messages.SET_CHANNEL_9),
-            (b'W', None), (b'xW060110X', messages.SET_CHANNEL_10),
-            (b'E', None), (b'xE060110X', messages.SET_CHANNEL_11),
-            (b'R', None), (b'xR060110X', messages.SET_CHANNEL_12),
-            (b'T', None), (b'xT060110X', messages.SET_CHANNEL_13),
-            (b'Y', None), (b'xY060110X', messages.SET_CHANNEL_14),
-            (b'U', None), (b'xU060110X', messages.SET_CHANNEL_15),
-            (b'I', None), (b'xI060110X', messages.SET_CHANNEL_16),
+            *BOARD_SETUP,
+            *CHANNEL_SETUP_16,
         ]
         with cyton_mock:
             pass
 
 
+# Standard packet with accel. EEG 1 - 4 are full scale positive,
+# full scale negative, -1 and 1.
+_PACKET_0xC0 = (
+    b'\xa0'          # Start byte
+    b'w'             # Packet ID
+    b'\x7f\xff\xff'  # EEG 1
+    b'\x80\x00\x00'  # EEG 2
+    b'\xff\xff\xff'  # EEG 3
+    b'\x00\x00\x01'  # EEG 4
+    b'\x00\x00\x00'  # EEG 5
+    b'\x00\x00\x00'  # EEG 6
+    b'\x00\x00\x00'  # EEG 7
+    b'\x00\x00\x00'  # EEG 8
+    b'\x00\x00'      # AUX 1
+    b'\x00\x00'      # AUX 2
+    b'\x00\x00'      # AUX 3
+    b'\xc0'          # Stop byte
+)
+_RAW_EEG_0xC0 = [2 ** 23 - 1, -2 ** 23, -1, 1, 0, 0, 0, 0]
+_EEG_SCALE_24 = 1000000. * 4.5 / 24 / (2 ** 23 - 1)
+_EXPECTED_0xC0 = {
+    'eeg': pytest.approx([val * _EEG_SCALE_24 for val in _RAW_EEG_0xC0]),
+    'aux': pytest.approx([0.0] * 3),
+    'raw_eeg': _RAW_EEG_0xC0,
+    'raw_aux': [0] * 3,
+    'packet_id': 119,
+    'timestamp': None,
+    'valid': True,
+}
+
+
+def _set_all_gains(board, gain):
+    """Set the gain of all the channels, applied when streaming starts"""
+    for cfg in board.channel_configs:
+        cfg.gain = gain
+
+
+# EEG payload with all the channels at 1
+_EEG_ONES = b'\x00\x00\x01' * 8
+
+
 @pytest.mark.cyton_sample_acquisition
 class TestCytonReadSample:
     """Sample Acquisition
     """
     @staticmethod
-    def test_read_sample_0xC0(cyton_mock):
+    @pytest.mark.parametrize('stop_byte', [
+        0xC0, 0xC1, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6,
+    ], ids='0x{:02X}'.format)
+    def test_read_sample(cyton_mock, stop_byte):
+        """Test acquisition of sample. Only 0xC0 (with accel) is valid"""
+        _set_all_gains(cyton_mock, 24)
+        packet = _PACKET_0xC0[:-1] + bytes([stop_byte])
+        cyton_mock._serial.patterns = [(b'b', packet)]
+        expected = dict(_EXPECTED_0xC0, valid=stop_byte == 0xC0)
+        cyton_mock.start_streaming()
+        if stop_byte == 0xC0:
+            sample = cyton_mock.read_sample()
+        else:
+            with pytest.warns(UserWarning):
+                sample = cyton_mock.read_sample()
+
+        assert sample == dict(expected, timestamp=sample['timestamp'])
+
+    @staticmethod
+    def test_read_sample_0xC0_daisy(cyton_mock):
         """Test acquisition of standard sample with accel"""
-        for cfg in cyton_mock.channel_configs:
-            cfg.gain = 24
+        _set_all_gains(cyton_mock, 24)
         cyton_mock._serial.patterns = [(
-            b'b',
-            # Packet
-            b'\xa0'          # Start byte
-            b'w'             # Packet ID
-            b'\x00\x00\x00'  # EEG 1
-            b'\x00\x00\x00'  # EEG 2
-            b'\x00\x00\x00'  # EEG 3
-            b'\x00\x00\x00'  # EEG 4
-            b'\x00\x00\x00'  # EEG 5
-            b'\x00\x00\x00'  # EEG 6
-            b'\x00\x00\x00'  # EEG 7
-            b'\x00\x00\x00'  # EEG 8
-            b'\x00\x00'      # AUX 1
-            b'\x00\x00'      # AUX 2
-            b'\x00\x00'      # AUX 3
-            b'\xc0'          # Stop byte
-        )]
+            b'b', build_packet(ord('w')) + build_packet(ord('x')))]
         expected = {
-            'eeg': [0.0] * 8,
-            'aux': [0.0] * 3,
-            'raw_eeg': [0] * 8,
+            'eeg': pytest.approx([0.0] * 16),
+            'aux': pytest.approx([0.0] * 3),
+            'raw_eeg': [0] * 16,
             'raw_aux': [0] * 3,
             'packet_id': 119,
             'timestamp': None,
             'valid': True,
         }
+        cyton_mock.daisy_attached = True
         cyton_mock.start_streaming()
         sample = cyton_mock.read_sample()
 
-        assert sample.keys() == expected.keys()
+        assert sample == dict(expected, timestamp=sample['timestamp'])
 
-        for key in sample:
-            if key != 'timestamp':
-                assert sample[key] == expected[key]
+    @staticmethod
+    def test_read_sample_eeg_values(cyton_mock):
+        """Recorded EEG bytes are converted to micro volts"""
+        eeg = (
+            b'\xd1+\x02' b'\xcd\x81\x13' b'\xcf\xcf\x1d' b'\xcf_C'
+            b'\xce\xf4U' b'\x03_\xce' b'\x03U\x92' b'\x03\\I'
+        )
+        cyton_mock._serial.patterns = [(b'b', build_packet(ord('w'), eeg))]
+        _set_all_gains(cyton_mock, 24)
+        cyton_mock.start_streaming()
+        sample = cyton_mock.read_sample()
+        assert sample['eeg'] == pytest.approx([
+            -68601.57175082824, -73968.47146373648,
+            -70592.24046376234, -71232.26031449561,
+            -71844.11696721519, 4942.730658379872,
+            4884.169087906967, 4922.59173662564,
+        ])
 
     @staticmethod
-    def test_read_sample_0xC0_daisy(cyton_mock):
-        """Test acquisition of standard sample with accel"""
-        for cfg in cyton_mock.channel_configs:
-            cfg.gain = 24
+    def test_read_sample_gain(cyton_mock):
+        """EEG values are scaled with the gain set by configure_channel"""
+        cyton_mock._serial.patterns = [
+            (b'x1000110X', messages.SET_CHANNEL_1),
+            (b'b', build_packet(ord('w'), eeg=b'\x00\x01\x00' * 8)),
+        ]
+        cyton_mock.configure_channel(1, gain=1)
+        with pytest.warns(UserWarning):
+            cyton_mock.start_streaming()
+        sample = cyton_mock.read_sample()
+        assert sample['eeg'] == pytest.approx(
+            [256 * cyton._get_eeg_scale(1)] +
+            [256 * cyton._get_eeg_scale(24)] * 7
+        )
+
+    @staticmethod
+    def test_read_sample_gain_assigned(cyton_mock):
+        """Gain values in channel_configs are applied when streaming starts"""
+        cyton_mock._serial.patterns = [
+            (b'b', build_packet(ord('w'), eeg=b'\x00\x01\x00' * 8)),
+        ]
+        _set_all_gains(cyton_mock, 24)
+        cyton_mock.channel_configs[1].gain = 2
+        cyton_mock.start_streaming()
+        sample = cyton_mock.read_sample()
+        assert sample['eeg'] == pytest.approx(
+            [256 * cyton._get_eeg_scale(24)] +
+            [256 * cyton._get_eeg_scale(2)] +
+            [256 * cyton._get_eeg_scale(24)] * 6
+        )
+
+    @staticmethod
+    def test_read_samples(cyton_mock):
+        """Multiple samples are returned in column-wise layout"""
+        _set_all_gains(cyton_mock, 24)
         cyton_mock._serial.patterns = [(
             b'b',
-            # Packet 1
-            b'\xa0'          # Start byte
-            b'w'             # Packet ID
-            b'\x00\x00\x00'  # EEG 1
-            b'\x00\x00\x00'  # EEG 2
-            b'\x00\x00\x00'  # EEG 3
-            b'\x00\x00\x00'  # EEG 4
-            b'\x00\x00\x00'  # EEG 5
-            b'\x00\x00\x00'  # EEG 6
-            b'\x00\x00\x00'  # EEG 7
-            b'\x00\x00\x00'  # EEG 8
-            b'\x00\x00'      # AUX 1
-            b'\x00\x00'      # AUX 2
-            b'\x00\x00'      # AUX 3
-            b'\xc0'          # Stop byte
-            # Packet 2
-            b'\xa0'          # Start byte
-            b'x'             # Packet ID
-            b'\x00\x00\x00'  # EEG 9
-            b'\x00\x00\x00'  # EEG 10
-            b'\x00\x00\x00'  # EEG 11
-            b'\x00\x00\x00'  # EEG 12
-            b'\x00\x00\x00'  # EEG 13
-            b'\x00\x00\x00'  # EEG 14
-            b'\x00\x00\x00'  # EEG 15
-            b'\x00\x00\x00'  # EEG 16
-            b'\x00\x00'      # AUX 1
-            b'\x00\x00'      # AUX 2
-            b'\x00\x00'      # AUX 3
-            b'\xc0'          # Stop byte
+            build_packet(ord('w')) +
+            build_packet(
+                ord('x'), eeg=_EEG_ONES, aux=b'\x00\x01' * 3, stop_byte=0xC1)
         )]
-        expected = {
-            'eeg': [0.0] * 16,
-            'aux': [0.0] * 3,
-            'raw_eeg': [0] * 16,
-            'raw_aux': [0] * 3,
-            'packet_id': 119,
-            'timestamp': None,
-            'valid': True,
-        }
-        cyton_mock.daisy_attached = True
         cyton_mock.start_streaming()
-        sample = cyton_mock.read_sample()
+        samples = cyton_mock.read_samples(2)
+
+        assert samples['packet_id'] == [119, 120]
+        assert samples['raw_eeg'] == [[0] * 8, [1] * 8]
+        assert samples['raw_aux'] == [[0] * 3, [1] * 3]
+        assert samples['valid'] == [True, False]
+        assert len(samples['eeg']) == 2
+        assert len(samples['aux']) == 2
+        assert len(samples['timestamp']) == 2
+
+    @staticmethod
+    def test_read_samples_timestamps(cyton_mock):
+        """Timestamps are derived from sample rate"""
+        _set_all_gains(cyton_mock, 24)
+        cyton_mock._serial.patterns = [(b'b', build_packet(ord('w')) * 3)]
+        cyton_mock.sample_rate = 250
+        cyton_mock.start_streaming()
+        samples = cyton_mock.read_samples(3)
 
-        assert sample.keys() == expected.keys()
+        timestamps = samples['timestamp']
+        assert len(timestamps) == 3
+        cycle = pytest.approx(1 / 250, abs=1e-6)
+        assert timestamps[1] - timestamps[0] == cycle
+        assert timestamps[2] - timestamps[1] == cycle
 
-        for key in sample:
-            if key != 'timestamp':
-                assert sample[key] == expected[key]
+    @staticmethod
+    def test_read_samples_batch_resync(cyton_mock):
+        """Packets out of sync are read one by one"""
+        _set_all_gains(cyton_mock, 24)
+        cyton_mock._serial.patterns = [(
+            b'b',
+            build_packet(0, eeg=_EEG_ONES) +
+            build_packet(1, eeg=_EEG_ONES, stop_byte=0x00) +  # Broken
+            build_packet(2, eeg=_EEG_ONES) +
+            build_packet(3, eeg=_EEG_ONES)
+        )]
+        cyton_mock.sample_rate = 250
+        cyton_mock.start_streaming()
+        samples = cyton_mock.read_samples(3)
+        assert samples['packet_id'] == [0, 2, 3]
+        assert samples['raw_eeg'] == [[1] * 8] * 3
+        assert all(samples['valid'])
 
     @staticmethod
-    def test_read_sample_0xC1(cyton_mock):
-        """Test acquisition of standard sample with accel"""
-        for cfg in cyton_mock.channel_configs:
-            cfg.gain = 24
+    def test_read_sample_realign(cyton_mock):
+        """Bytes received before start byte are skipped"""
+        _set_all_gains(cyton_mock, 24)
         cyton_mock._serial.patterns = [(
             b'b',
-            b'\xa0'          # Start byte
-            b'w'             # Packet ID
-            b'\x00\x00\x00'  # EEG 1
-            b'\x00\x00\x00'  # EEG 2
-            b'\x00\x00\x00'  # EEG 3
-            b'\x00\x00\x00'  # EEG 4
-            b'\x00\x00\x00'  # EEG 5
-            b'\x00\x00\x00'  # EEG 6
-            b'\x00\x00\x00'  # EEG 7
-            b'\x00\x00\x00'  # EEG 8
-            b'\x00\x00'      # AUX 1
-            b'\x00\x00'      # AUX 2
-            b'\x00\x00'      # AUX 3
-            b'\xc1'          # Stop byte
+            b'\x00\x01\xc0'  # Tail of a previous packet
+            + build_packet(ord('w'), eeg=_EEG_ONES)
         )]
-        expected = {
-            'eeg': [0.0] * 8,
-            'aux': [0.0] * 3,
-            'raw_eeg': [0] * 8,
-            'raw_aux': [0] * 3,
-            'packet_id': 119,
-            'timestamp': None,
-            'valid': False,
-        }
         cyton_mock.start_streaming()
         sample = cyton_mock.read_sample()
+        assert sample['packet_id'] == 119
+        assert sample['raw_eeg'] == [1] * 8
+        assert sample['valid']
 
-        assert sample.keys() == expected.keys()
-
-        for key in sample:
-            if key != 'timestamp':
-                assert sample[key] == expected[key]
+    @staticmethod
+    def test_read_sample_resync(cyton_mock):
+        """Packet without valid stop byte is skipped"""
+        _set_all_gains(cyton_mock, 24)
+        cyton_mock._serial.patterns = [(
+            b'b',
+            b'\xa0\x01\x02'  # Broken packet
+            + build_packet(ord('w'), eeg=_EEG_ONES)
+        )]
+        cyton_mock.start_streaming()
+        sample = cyton_mock.read_sample()
+        assert sample['packet_id'] == 119
+        assert sample['raw_eeg'] == [1] * 8
+        assert sample['valid']
 
     @staticmethod
     def test_read_sample_timeout(cyton_mock):
@@ -656,6 +664,20 @@ class TestCytonReadSample:
         with pytest.raises(exception.SampleAcquisitionTimeout):
             cyton_mock.read_sample()
 
+    @staticmethod
+    @pytest.mark.cyton_partial_packet
+    def test_read_sample_timeout_truncated(cyton_mock):
+        """read_sample raises SampleAcquisitionTimeout on truncated packet."""
+        cyton_mock._serial.patterns = [(
+            b'b',
+            b'\xa0'          # Start byte
+            b'w'             # Packet ID
+            b'\x00\x00\x00'  # EEG 1, then timeout
+        )]
+        cyton_mock.start_streaming()
+        with pytest.raises(exception.SampleAcquisitionTimeout):
+            cyton_mock.read_sample()
+
 
 class TestCytonConfigIO:
     """Configuration seliarazation"""
@@ -665,25 +687,8 @@ class TestCytonConfigIO:
         cyton_mock._serial.patterns = [
             (b'v', messages.CYTON_V3_WITH_DAISY_INFO),
             (b'V', b'v3.1.1$$$'),
-            (b'/0', messages.BOARD_MODE_DEFAULT),
-            (b'~6', messages.SAMPLE_RATE_250),
-            (b'D', b'060110$$$'),
-            (b'!', None), (b'x1060110X', messages.SET_CHANNEL_1),
-            (b'@', None), (b'x2060110X', messages.SET_CHANNEL_2),
-            (b'#', None), (b'x3060110X', messages.SET_CHANNEL_3),
-            (b'$', None), (b'x4060110X', messages.SET_CHANNEL_4),
-            (b'%', None), (b'x5060110X', messages.SET_CHANNEL_5),
-            (b'^', None), (b'x6060110X', messages.SET_CHANNEL_6),
-            (b'&', None), (b'x7060110X', messages.SET_CHANNEL_7),
-            (b'*', None), (b'x8060110X', messages.SET_CHANNEL_8),
-            (b'Q', None), (b'xQ060110X', messages.SET_CHANNEL_9),
-            (b'W', None), (b'xW060110X', messages.SET_CHANNEL_10),
-            (b'E', None), (b'xE060110X', messages.SET_CHANNEL_11),
-            (b'R', None), (b'xR060110X', messages.SET_CHANNEL_12),
-            (b'T', None), (b'xT060110X', messages.SET_CHANNEL_13),
-            (b'Y', None), (b'xY060110X', messages.SET_CHANNEL_14),
-            (b'U', None), (b'xU060110X', messages.SET_CHANNEL_15),
-            (b'I', None), (b'xI060110X', messages.SET_CHANNEL_16),
+            *BOARD_SETUP,
+            *CHANNEL_SETUP_16,
         ]
         with cyton_mock:
             configs = cyton_mock.get_config()
@@ -1,6 +1,6 @@
 """Test support functions in cyton module."""
 import os
-import struct
+import functools
 
 import pytest
 from openbci_interface import cyton, core
@@ -9,63 +9,76 @@ from openbci_interface import cyton, core
 # pylint: disable=bad-whitespace
 
 
-def _load_patterns(filename):
-    path = os.path.join(os.path.dirname(__file__), filename)
-    with open(path, 'r') as fileobj:
-        for line in fileobj:
-            line = line.strip()
-            if not line:
-                continue
-            vals = [int(val) for val in line.split()]
-            raw = struct.pack('b' * len(vals[:-1]), *vals[:-1])
-            expected = vals[-1]
-            yield raw, expected
+_DIR = os.path.dirname(__file__)
 
 
-def test_interpret_16bit_as_int32():
-    """interpret16bitAsInt32 works same way as official java example
+@functools.lru_cache(maxsize=None)
+def _load_patterns(filename):
+    with open(os.path.join(_DIR, filename), 'r') as fileobj:
+        lines = fileobj.read().splitlines()
+    patterns = []
+    for line in lines:
+        vals = [int(val) for val in line.split()]
+        if not vals:
+            continue
+        # Values are signed bytes, followed by the expected value
+        patterns.append((bytes(val & 0xFF for val in vals[:-1]), vals[-1]))
+    return tuple(patterns)
 
-    http://docs.openbci.com/Hardware/03-Cyton_Data_Format#cyton-data-format-16-bit-signed-data-values
-    """
-    for raw, expected in _load_patterns('16bit_patterns.txt'):
-        assert core._interpret_16bit_as_int32(raw) == expected
 
+def _chunk_patterns(filename, size):
+    """Split patterns into chunks of ``size``, wrapping around at the end"""
+    patterns = _load_patterns(filename)
+    patterns += patterns[:size - 1]
+    for i in range(0, len(patterns) - size + 1, size):
+        raws, expected = zip(*patterns[i:i+size])
+        yield b''.join(raws), list(expected)
 
-def test_interpret_24bit_as_int32():
-    """interpret24bitAsInt32 works same way as official java example
+
+def test_unpack_packet_eeg():
+    """EEG values are unpacked same way as official java example
 
     http://docs.openbci.com/Hardware/03-Cyton_Data_Format#cyton-data-format-24-bit-signed-data-values
     """
-    for raw, expected in _load_patterns('24bit_patterns.txt'):
-        assert core._interpret_24bit_as_int32(raw) == expected
-
-
-@pytest.mark.parametrize('raw_eeg,expected', [
-    (b'\xd1+\x02',    -68601.57175082824),
-    (b'\xcd\x81\x13', -73968.47146373648),
-    (b'\xcf\xcf\x1d', -70592.24046376234),
-    (b'\xcf_C',       -71232.26031449561),
-    (b'\xce\xf4U',    -71844.11696721519),
-    (b'\x03_\xce',    4942.730658379872),
-    (b'\x03U\x92',    4884.169087906967),
-    (b'\x03\\I',      4922.59173662564),
-])
-def test_parse_eeg(raw_eeg, expected):
-    """EEG values are parsed from bytes
+    for raw_eeg, expected in _chunk_patterns('24bit_patterns.txt', 8):
+        raw = b'w' + raw_eeg + b'\x00' * 6 + b'\xc0'
+        assert core._unpack_packet(raw)['raw_eeg'] == expected
+
+
+def test_unpack_packet_aux():
+    """AUX values are unpacked same way as official java example
+
+    http://docs.openbci.com/Hardware/03-Cyton_Data_Format#cyton-data-format-16-bit-signed-data-values
     """
-    raw_eeg = core._interpret_24bit_as_int32(raw_eeg)
-    output = cyton._parse_eeg(raw_eeg, gain=24)
-    assert output == expected
+    for raw_aux, expected in _chunk_patterns('16bit_patterns.txt', 3):
+        raw = b'w' + b'\x00' * 24 + raw_aux + b'\xc0'
+        assert core._unpack_packet(raw)['raw_aux'] == expected
+
+
+def test_unpack_packet():
+    """Packet ID, EEG, AUX and stop byte are unpacked from packet"""
+    raw = (
+        b'w'
+        + b'\xd1+\x02' + b'\x03_\xce' + b'\x00\x00\x00' * 6
+        + b'\x01\xb0\x07\x10\x1c\xc0'
+        + b'\xc0'
+    )
+    expected = {
+        'packet_id': 119,
+        'raw_eeg': [-3069182, 221134] + [0] * 6,
+        'raw_aux': [432, 1808, 7360],
+        'stop_byte': 0xC0,
+    }
+    assert core._unpack_packet(raw) == expected
 
 
 @pytest.mark.parametrize('raw_aux,expected', [
     (
-        [b'\x01\xb0', b'\x07\x10', b'\x1c\xc0'],
+        [432, 1808, 7360],  # b'\x01\xb0', b'\x07\x10', b'\x1c\xc0'
         [0.054, 0.226, 0.92],
     ),
 ])
 def test_parse_aux(raw_aux, expected):
-    """AUX values are parsed from bytes"""
-    raw_aux = [core._interpret_16bit_as_int32(d) for d in raw_aux]
+    """AUX values are parsed from decoded integers"""
     output = cyton._parse_aux(0xC0, raw_aux)
     assert output == expected
@@ -0,0 +1,37 @@
+"""I/O patterns and packets shared by Cyton tests"""
+from tests import messages
+
+
+def build_packet(
+        packet_id, eeg=b'\x00' * 24, aux=b'\x00' * 6, stop_byte=0xC0):
+    """Build a packet from packet ID, 24-byte EEG and 6-byte AUX payloads"""
+    return b'\xa0' + bytes([packet_id]) + eeg + aux + bytes([stop_byte])
+
+
+# Board mode, sample rate and default channel settings set by `initialize`
+BOARD_SETUP = (
+    (b'/0', messages.BOARD_MODE_DEFAULT),
+    (b'~6', messages.SAMPLE_RATE_250),
+    (b'D', b'060110$$$'),
+)
+# Channels enabled and configured with default settings by `initialize`
+CHANNEL_SETUP_8 = (
+    (b'!', None), (b'x1060110X', messages.SET_CHANNEL_1),
+    (b'@', None), (b'x2060110X', messages.SET_CHANNEL_2),
+    (b'#', None), (b'x3060110X', messages.SET_CHANNEL_3),
+    (b'$', None), (b'x4060110X', messages.SET_CHANNEL_4),
+    (b'%', None), (b'x5060110X', messages.SET_CHANNEL_5),
+    (b'^', None), (b'x6060110X', messages.SET_CHANNEL_6),
+    (b'&', None), (b'x7060110X', messages.SET_CHANNEL_7),
+    (b'*', None), (b'x8060110X', messages.SET_CHANNEL_8),
+)
+CHANNEL_SETUP_16 = CHANNEL_SETUP_8 + (
+    (b'Q', None), (b'xQ060110X', messages.SET_CHANNEL_9),
+    (b'W', None), (b'xW060110X', messages.SET_CHANNEL_10),
+    (b'E', None), (b'xE060110X', messages.SET_CHANNEL_11),
+    (b'R', None), (b'xR060110X', messages.SET_CHANNEL_12),
+    (b'T', None), (b'xT060110X', messages.SET_CHANNEL_13),
+    (b'Y', None), (b'xY060110X', messages.SET_CHANNEL_14),
+    (b'U', None), (b'xU060110X', messages.SET_CHANNEL_15),
+    (b'I', None), (b'xI060110X', messages.SET_CHANNEL_16),
+)
@@ -1,20 +1,53 @@
 import logging
-
-import serial as pyserial
+import collections
 
 _LG = logging.getLogger(__name__)
 
 
+class _LoopBuffer:
+    """In-memory loop back buffer.
+
+    Read returns immediately with whatever is available, which is what
+    Serial returns when read times out.
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self._buffer)
+
+    def read(self, size=1):
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read_until(self, expected=b'\n', size=None):
+        index = self._buffer.find(expected)
+        end = len(self._buffer) if index < 0 else index + len(expected)
+        if size is not None:
+            end = min(end, size)
+        return self.read(end)
+
+    def write(self, data):
+        self._buffer.extend(data)
+
+
 class SerialMock:
     """Mock Serial by providing the list of expected I/O strings.
 
-    Internally it uses loop back software-based connection.
+    Internally it uses in-memory loop back buffer.
+    I/O patterns can be given to constructor, or defined by subclasses as
+    ``_patterns`` class attribute. Each instance consumes its own copy.
     """
-    _patterns = None
-
-    def __init__(self, port='loop://', timeout=0.1, baudrate=115200):
-        self._serial = pyserial.serial_for_url(
-            url='loop://', timeout=timeout, baudrate=baudrate)
+    _patterns = ()
+
+    def __init__(
+            self, port='loop://', timeout=0.1, baudrate=115200,
+            patterns=None):
+        self._serial = _LoopBuffer()
+        self._patterns = collections.deque(
+            self._patterns if patterns is None else patterns)
         self.is_open = True
         self.port = port
         self.baudrate = baudrate
@@ -30,6 +63,10 @@ class SerialMock:
         """
         self.is_open = False
 
+    @property
+    def in_waiting(self):
+        return self._serial.in_waiting
+
     def read(self, size=1):
         return self._serial.read(size)
 
@@ -39,17 +76,13 @@ class SerialMock:
     def write(self, data):
         """Pseudo write method
 
-        It pass the input data through the srial for compatibility check,
-        then write the expected reaction message from pre-registered pattern.
+        It compares the input data against the pre-registered pattern,
+        then write the expected reaction message.
         """
-        # Pass data through the serial for compatibility validataion
-        self._serial.write(data)
-        assert data == self._serial.read(len(data))
-
         # Retrieve the expected message corresponding to the given data
         try:
-            expected, message = next(self._patterns)
-        except StopIteration:
+            expected, message = self._patterns.popleft()
+        except IndexError:
             raise AssertionError(
                 'All the I/O patterns are consumed. '
                 'No expected patterns for %s' % data
@@ -81,7 +114,7 @@ class SerialMock:
         _LG.debug('Registering patterns;')
         for pattern in patterns:
             _LG.debug(pattern)
-        self._patterns = iter(patterns)
+        self._patterns = collections.deque(patterns)
 
     def validate_no_message_in_buffer(self):
         """Validate that no message-to-be-read is present in Serial buffer"""
@@ -94,12 +127,8 @@ class SerialMock:
 
     def validate_all_patterns_consumed(self):
         """Validate that all the registered patterns are consumed"""
-        try:
-            pattern = next(self._patterns)
-        except StopIteration:
-            pass
-        else:
+        if self._patterns:
             raise AssertionError(
                 'Not all the I/O patterns are consumed. '
-                'Remaining patterns starts from: %s' % repr(pattern)
-            ) from None
+                'Remaining patterns starts from: %s' % repr(self._patterns[0])
+            )
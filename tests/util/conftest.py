@@ -1,41 +1,16 @@
 """Defines fixtures common to util module testing"""
+import pytest
 
+from openbci_interface import util
 
-CYTON_8BIT_FIRMWARE_STRING = b'''OpenBCI V3 8bit Board
-Setting ADS1299 Channel Values
-ADS1299 Device ID: 0x3E
-LIS3DH Device ID: 0x33
-$$$'''
+from tests import messages
 
 
-CYTON_V1_FIRMWARE_STRING = b'''OpenBCI V3 16 channel
-ADS1299 Device ID: 0x3E
-LIS3DH Device ID: 0x33
-$$$'''
-
-CYTON_V2_FIRMWARE_STRING = b'''OpenBCI V3 8-16 channel
-ADS1299 Device ID: 0x3E
-LIS3DH Device ID: 0x33
-Firmware: v2.0.0
-$$$'''
-
-CYTON_V3_FIRMWARE_STRING = b'''OpenBCI V3 8-16 channel
-On Board ADS1299 Device ID: 0x3E
-LIS3DH Device ID: 0x33
-Firmware: v3.1.1
-$$$'''
-
-CYTON_V3_WITH_DAISY_FIRMWARE_STRING = b'''OpenBCI V3 8-16 channel
-On Board ADS1299 Device ID: 0x3E
-On Daisy ADS1299 Device ID: 0x3E
-LIS3DH Device ID: 0x33
-Firmware: v3.1.1
-$$$'''
-
-GANGLION_V2_FIRMWARE_STRING = b'''OpenBCI Ganglion v2.0.0
-LIS2DH ID: 0x33
-MCP3912 CONFIG_1: 0xXX
-$$$'''
+@pytest.fixture(autouse=True)
+def clear_firmware_cache():
+    util.clear_firmware_cache()
+    yield
+    util.clear_firmware_cache()
 
 
 class SerialMock:
@@ -43,12 +18,12 @@ class SerialMock:
     firmware_strings = {
         'foo': b'',
         'bar': b'',
-        'cyton_8bit': CYTON_8BIT_FIRMWARE_STRING,
-        'cyton_v1': CYTON_V1_FIRMWARE_STRING,
-        'cyton_v2': CYTON_V2_FIRMWARE_STRING,
-        'cyton_v3': CYTON_V3_FIRMWARE_STRING,
-        'daisy_v3': CYTON_V3_WITH_DAISY_FIRMWARE_STRING,
-        'ganglion_v2': GANGLION_V2_FIRMWARE_STRING,
+        'cyton_8bit': messages.CYTON_8BIT_INFO,
+        'cyton_v1': messages.CYTON_V1_INFO,
+        'cyton_v2': messages.CYTON_V2_INFO,
+        'cyton_v3': messages.CYTON_V3_INFO,
+        'daisy_v3': messages.CYTON_V3_WITH_DAISY_INFO,
+        'ganglion_v2': messages.GANGLION_V2_INFO,
     }
 
     def __init__(self, port, baudrate=None, timeout=None):
@@ -56,7 +31,8 @@ class SerialMock:
         self.baudrate = baudrate
         self.timeout = timeout
 
-        self.buffer = None
+        self.buffer = b''
+        self._firmware = SerialMock.firmware_strings[port]
 
     def __enter__(self):
         return self
@@ -66,12 +42,21 @@ class SerialMock:
 
     def write(self, val):
         if val == b'v':
-            self.buffer = SerialMock.firmware_strings[self.port]
+            self.buffer = self._firmware
         else:
             raise ValueError(
                 '%s does not support `write` method with value `%s`'
                 % (self.__class__.__name__, val)
             )
 
-    def read_until(self, _):
-        return self.buffer
+    @property
+    def in_waiting(self):
+        return len(self.buffer)
+
+    def read(self, size=1):
+        ret, self.buffer = self.buffer[:size], self.buffer[size:]
+        return ret
+
+
+# (device, firmware string) pairs of the mocked serial ports
+_FIRMWARE_ITEMS = tuple(SerialMock.firmware_strings.items())
@@ -4,14 +4,29 @@ import pytest
 
 from openbci_interface import util
 
+from tests import messages
+
 from . import conftest
 
 pytestmark = [pytest.mark.util, pytest.mark.util_list_devices]
 
 
+Port = namedtuple('ComPort', ['device', 'vid', 'pid', 'serial_number'])
+
+
 def _comports():
-    Port = namedtuple('ComPort', ['device'])
-    return [Port(device) for device in conftest.SerialMock.firmware_strings]
+    return [
+        Port(device, None, None, None)
+        for device, _ in conftest._FIRMWARE_ITEMS
+    ]
+
+
+def _comports_with_dongle():
+    return [
+        Port(device, 0x0403, 0x6015, 'DQ00ABCD') if device == 'cyton_v3' else
+        Port(device, None, None, None)
+        for device, _ in conftest._FIRMWARE_ITEMS
+    ]
 
 
 @pytest.mark.parametrize('filter_pattern,expected', [
@@ -30,6 +45,10 @@ def _comports():
             'daisy_v3', 'ganglion_v2',
         ],
     ),
+    (
+        r'v[23]\.\d',
+        ['cyton_v2', 'cyton_v3', 'daisy_v3', 'ganglion_v2'],
+    ),
 ])
 def test_list_devices(mocker, filter_pattern, expected):
     mocker.patch.object(util.serial, 'Serial', conftest.SerialMock)
@@ -37,3 +56,109 @@ def test_list_devices(mocker, filter_pattern, expected):
 
     found = util.list_devices(filter_pattern)
     assert sorted(found) == sorted(expected)
+
+
+def test_list_devices_no_port(mocker):
+    mocker.patch.object(util.serial, 'Serial', conftest.SerialMock)
+    mocker.patch.object(util.serial.tools.list_ports, 'comports', list)
+
+    assert list(util.list_devices()) == []
+
+
+@pytest.mark.parametrize('kwargs,expected', [
+    ({}, ['cyton_v3', 'daisy_v3']),
+    ({'strict_vid': True}, ['cyton_v3']),
+    ({'strict_vid': False}, ['cyton_v3', 'daisy_v3']),
+], ids=['default', 'strict', 'not-strict'])
+def test_list_devices_strict_vid(mocker, kwargs, expected):
+    mocker.patch.object(util.serial, 'Serial', conftest.SerialMock)
+    mocker.patch.object(
+        util.serial.tools.list_ports, 'comports', _comports_with_dongle)
+
+    found = util.list_devices('v3', **kwargs)
+    assert sorted(found) == expected
+
+
+def test_list_devices_cache(mocker):
+    serial_mock = mocker.patch.object(
+        util.serial, 'Serial', side_effect=conftest.SerialMock)
+    mocker.patch.object(util.serial.tools.list_ports, 'comports', _comports)
+
+    expected = sorted(util.list_devices())
+    n_calls = serial_mock.call_count
+    assert sorted(util.list_devices()) == expected
+    assert serial_mock.call_count == n_calls
+
+    util.clear_firmware_cache()
+    assert sorted(util.list_devices()) == expected
+    assert serial_mock.call_count == 2 * n_calls
+
+
+class _TricklingSerialMock(conftest.SerialMock):
+    """Returns one byte per read, and has bytes after ``$$$``"""
+    in_waiting = 0
+    timeouts = []
+
+    def __setattr__(self, name, value):
+        if name == 'timeout':
+            self.timeouts.append(value)
+        super().__setattr__(name, value)
+
+    def write(self, val):
+        super().write(val)
+        self.buffer += b'\nfoo'
+
+
+def test_get_firmware_string_trickle(mocker):
+    mocker.patch.object(util.serial, 'Serial', _TricklingSerialMock)
+    mocker.patch.object(_TricklingSerialMock, 'timeouts', [])
+
+    msg = util._get_firmware_string('cyton_v3', timeout=2)
+    assert msg == messages.CYTON_V3_INFO
+    # Timeout is not reconfigured while reading
+    assert _TricklingSerialMock.timeouts == [2]
+
+
+def test_list_devices_dongle_timeout(mocker):
+    serial_mock = mocker.patch.object(
+        util.serial, 'Serial', side_effect=conftest.SerialMock)
+    mocker.patch.object(
+        util.serial.tools.list_ports, 'comports', _comports_with_dongle)
+
+    list(util.list_devices(timeout=2, strict_vid=False))
+    timeouts = {
+        kwargs['port']: kwargs['timeout']
+        for _, kwargs in serial_mock.call_args_list
+    }
+    assert timeouts.pop('cyton_v3') == 0.5
+    assert set(timeouts.values()) == {2}
+
+
+@pytest.mark.parametrize('platform,expected', [
+    ('darwin', ['/dev/cu.usbserial-DQ00ABCD']),
+    (
+        'linux',
+        ['/dev/tty.usbserial-DQ00ABCD', '/dev/cu.usbserial-DQ00ABCD'],
+    ),
+])
+def test_unique_ports(mocker, platform, expected):
+    """Only `tty`/`cu` aliases on macOS are skipped"""
+    mocker.patch.object(util.sys, 'platform', platform)
+    ports = [
+        Port('/dev/tty.usbserial-DQ00ABCD', 0x0403, 0x6015, 'DQ00ABCD'),
+        Port('/dev/cu.usbserial-DQ00ABCD', 0x0403, 0x6015, 'DQ00ABCD'),
+        Port('/dev/ttyS0', None, None, None),
+        Port('/dev/ttyS1', None, None, None),
+    ]
+    found = [port.device for port in util._unique_ports(ports)]
+    assert found == expected + ['/dev/ttyS0', '/dev/ttyS1']
+
+
+@pytest.mark.parametrize('platform', ['darwin', 'linux', 'win32'])
+def test_unique_ports_multi_port_chip(mocker, platform):
+    """Interfaces of a multi-port chip share serial number, but are kept"""
+    mocker.patch.object(util.sys, 'platform', platform)
+    ports = [
+        Port('/dev/ttyUSB%d' % i, 0x0403, 0x6011, 'FT4232') for i in range(4)
+    ]
+    assert util._unique_ports(ports) == ports
@@ -0,0 +1,31 @@
+import pytest
+
+from openbci_interface import util, exception
+
+pytestmark = [pytest.mark.util]
+
+
+@pytest.mark.parametrize('message', [
+    'v3.1.1$$$',
+    b'v3.1.1$$$',
+], ids=['str', 'bytes'])
+def test_validate_message(message):
+    util.validate_message(message)
+
+
+@pytest.mark.parametrize('message', [
+    'v3.1.1',
+    b'v3.1.1',
+], ids=['str', 'bytes'])
+def test_validate_message_unexpected_format(message):
+    with pytest.raises(exception.UnexpectedMessageFormat):
+        util.validate_message(message)
+
+
+@pytest.mark.parametrize('message', [
+    'Device failed to poll Host$$$',
+    b'Device failed to poll Host$$$',
+], ids=['str', 'bytes'])
+def test_validate_message_not_connected(message):
+    with pytest.raises(exception.DeviceNotConnected):
+        util.validate_message(message)